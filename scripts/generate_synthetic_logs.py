@@ -13,10 +13,11 @@ Designed to match sql/schema.sql exactly.
 from __future__ import annotations
 
 import argparse
-import random
+import csv
 import re
-import uuid
-from dataclasses import dataclass
+import secrets
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -25,10 +26,18 @@ import pandas as pd
 
 
 JST = timezone(timedelta(hours=9))
+JST_SUFFIX = "+09:00"
 
+# Search events simulated (and written) per batch
+CHUNK_SIZE = 50_000
 
-def new_id(prefix: str) -> str:
-    return f"{prefix}_{uuid.uuid4().hex[:16]}"
+
+def bulk_ids(prefix: str, n: int) -> list[str]:
+    """
+    n random ids like "se_1f2e3d4c5b6a7988", sliced from one bulk hex token.
+    """
+    h = secrets.token_hex(8 * n)
+    return [f"{prefix}_{h[i:i + 16]}" for i in range(0, 16 * n, 16)]
 
 
 def now_jst_iso() -> str:
@@ -36,26 +45,67 @@ def now_jst_iso() -> str:
     return datetime.now(JST).replace(microsecond=0).isoformat()
 
 
-KANJI_RE = re.compile(r"[\u4E00-\u9FFF]")
-KANA_RE = re.compile(r"[\u3040-\u30FF]")  # hiragana + katakana
-ROMAJI_RE = re.compile(r"[A-Za-z]")
-HALFWIDTH_KANA_RE = re.compile(r"[\uFF65-\uFF9F]")
-
-
-def has_kanji(s: str) -> int:
-    return 1 if KANJI_RE.search(s) else 0
-
-
-def has_kana(s: str) -> int:
-    return 1 if KANA_RE.search(s) else 0
-
-
-def has_romaji(s: str) -> int:
-    return 1 if ROMAJI_RE.search(s) else 0
-
+def iso_jst(base_ts: datetime, offsets_sec: np.ndarray) -> np.ndarray:
+    """
+    ISO strings like base_ts.isoformat() for base_ts + offsets_sec seconds, formatted in one pass.
+    """
+    base = np.datetime64(base_ts.replace(tzinfo=None), "s")
+    return np.char.add(np.datetime_as_string(base + offsets_sec, unit="s"), JST_SUFFIX)
+
+
+AMBIG_RE = re.compile(r"\bhero\b|グリーン|green", re.IGNORECASE)
+
+# Inclusive code point ranges per script flag
+SCRIPT_RANGES = {
+    "has_kanji": [(0x4E00, 0x9FFF)],
+    "has_kana": [(0x3040, 0x30FF)],  # hiragana + katakana
+    "has_romaji": [(0x41, 0x5A), (0x61, 0x7A)],  # A-Z, a-z
+    "has_halfwidth_kana": [(0xFF65, 0xFF9F)],
+}
+
+SEARCH_EVENT_COLUMNS = [
+    "event_id",
+    "ts",
+    "user_id",
+    "session_id",
+    "locale",
+    "device",
+    "query_raw",
+    "query_norm",
+    "vertical",
+    "results_count",
+    "has_kanji",
+    "has_kana",
+    "has_romaji",
+    "has_halfwidth_kana",
+    "query_len",
+]
+
+CLICK_EVENT_COLUMNS = ["click_id", "ts", "session_id", "event_id", "content_id", "rank", "dwell_sec"]
+
+
+def script_flags(queries: pd.Series) -> pd.DataFrame:
+    """
+    0/1 script flags for a whole query column.
 
-def has_halfwidth_kana(s: str) -> int:
-    return 1 if HALFWIDTH_KANA_RE.search(s) else 0
+    All queries are decoded into one uint32 code point array; each flag is a range test over
+    that array followed by a per-query any() via reduceat.
+    """
+    lengths = queries.str.len().to_numpy()
+    cp = np.frombuffer("".join(queries).encode("utf-32-le"), dtype=np.uint32)
+    nonempty = lengths > 0
+    starts = (np.cumsum(lengths) - lengths)[nonempty]
+
+    flags = {}
+    for col, ranges in SCRIPT_RANGES.items():
+        hit = np.zeros(len(cp), dtype=bool)
+        for lo, hi in ranges:
+            hit |= (cp >= lo) & (cp <= hi)
+        flag = np.zeros(len(lengths), dtype=np.int8)
+        if len(cp):
+            flag[nonempty] = np.logical_or.reduceat(hit, starts)
+        flags[col] = flag
+    return pd.DataFrame(flags, index=queries.index)
 
 
 def normalize_query(q: str) -> str:
@@ -63,10 +113,7 @@ def normalize_query(q: str) -> str:
     # - strip
     # - collapse whitespace
     # - lowercase romaji
-    q2 = q.strip()
-    q2 = re.sub(r"\s+", " ", q2)
-    q2 = q2.lower()
-    return q2
+    return " ".join(q.strip().lower().split())
 
 
 @dataclass(frozen=True)
@@ -180,257 +227,299 @@ def build_seed_entities() -> list[Entity]:
     ]
 
 
-def expand_catalog(seed: list[Entity], n_items: int, rng: random.Random) -> pd.DataFrame:
+def expand_catalog(seed: list[Entity], n_items: int, gen: np.random.Generator) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Create a synthetic catalog by cloning seed entities and adding some noise.
     """
-    rows = []
-    base_date = datetime(2015, 1, 1, tzinfo=JST)
-
-    for _ in range(n_items):
-        e = rng.choice(seed)
-        content_id = new_id("c")
-
-        # popularity skew: long-tail heavy
-        popularity = float(np.clip(np.random.lognormal(mean=0.0, sigma=1.0), 0.0, 100.0))
-        # release dates spread
-        rel = base_date + timedelta(days=int(rng.random() * 3650))
-        release_date = rel.date().isoformat()
-
-        rows.append(
-            dict(
-                content_id=content_id,
-                type=e.type,
-                title=e.title,
-                artist_or_show=e.artist_or_show,
-                language=e.language,
-                explicit_flag=int(e.explicit_flag),
-                release_date=release_date,
-                popularity=popularity,
-                vertical=e.vertical,  # not in schema, but useful internally
-                aliases=e.aliases,
-            )
-        )
-
-    df = pd.DataFrame(rows)
+    base_date = np.datetime64("2015-01-01")
+
+    # clone seed entities by index; vertical + aliases are not in schema, but useful internally
+    seed_idx = gen.integers(0, len(seed), size=n_items)
+    df = pd.DataFrame([asdict(e) for e in seed]).iloc[seed_idx].reset_index(drop=True)
+    df.insert(0, "content_id", bulk_ids("c", n_items))
+    # artist_or_show is a str or None (object dtype, never NaN), so consumers can test `is None`
+    df["artist_or_show"] = pd.Series([seed[i].artist_or_show or None for i in seed_idx], dtype=object)
+
+    # release dates spread
+    df["release_date"] = (base_date + gen.integers(0, 3650, size=n_items)).astype(str)
+    # popularity skew: long-tail heavy
+    df["popularity"] = np.clip(gen.lognormal(mean=0.0, sigma=1.0, size=n_items), 0.0, 100.0)
 
     # Ensure schema columns only for output content_catalog.csv
     out = df[
         ["content_id", "type", "title", "artist_or_show", "language", "explicit_flag", "release_date", "popularity"]
     ].copy()
+    for c in ["type", "language"]:
+        out[c] = out[c].astype("category")
 
     return out, df  # out for CSV, df internal w/ vertical+aliases
 
 
-def sample_query_from_entity(e_row: pd.Series, rng: random.Random) -> str:
+@dataclass(frozen=True)
+class CatalogArrays:
+    """
+    Column arrays of the internal catalog, indexed by catalog row, for the simulation hot path.
+    """
+
+    content_ids: np.ndarray
+    titles: list[str]
+    artists: list[str | None]
+    aliases: list[list[str]]
+    verticals: list[str]
+
+
+def catalog_arrays(catalog_internal: pd.DataFrame) -> CatalogArrays:
+    return CatalogArrays(
+        content_ids=catalog_internal["content_id"].to_numpy(object),
+        titles=catalog_internal["title"].astype(str).tolist(),
+        artists=catalog_internal["artist_or_show"].tolist(),
+        aliases=catalog_internal["aliases"].tolist(),
+        verticals=catalog_internal["vertical"].astype(str).tolist(),
+    )
+
+
+def sample_query_from_entity(cat: CatalogArrays, idx: int, u_alias: float, u_pick: float) -> str:
+    """
+    Query for catalog row idx, driven by two pre-drawn uniforms: u_alias decides alias vs. title
+    form, u_pick picks among the candidates.
+    """
     # Use seed-like alias behavior: pick an alias sometimes; otherwise title/artist combos.
-    aliases = e_row.get("aliases", [])
-    if isinstance(aliases, list) and aliases and rng.random() < 0.55:
-        return rng.choice(aliases)
+    aliases = cat.aliases[idx]
+    if aliases and u_alias < 0.55:
+        return aliases[int(u_pick * len(aliases))]
 
-    title = str(e_row["title"])
-    a = e_row.get("artist_or_show", None)
-    if pd.isna(a) or a is None:
+    title = cat.titles[idx]
+    artist = cat.artists[idx]
+    if artist is None:
         return title
 
-    artist = str(a)
     patterns = [
         f"{artist} {title}",
         f"{title} {artist}",
         f"{title}",
     ]
-    return rng.choice(patterns)
+    return patterns[int(u_pick * len(patterns))]
 
 
-def make_bad_variant(q: str, rng: random.Random) -> str:
+def make_bad_variants(queries: pd.Series, gen: np.random.Generator) -> pd.Series:
     """
     Introduce realistic JP input issues: spacing, casing, punctuation, half-width noise.
+
+    Column-wise: each issue hits an independent random subset of the queries.
     """
-    out = q
+    n = len(queries)
+    out = queries
 
     # random extra spaces
-    if rng.random() < 0.25:
-        out = re.sub(r"\s+", " ", out)
-        out = out.replace(" ", "  ")
+    out = out.mask(gen.random(n) < 0.25, out.str.split().str.join("  "))
 
     # random punctuation / brackets noise
-    if rng.random() < 0.18:
-        out = out + rng.choice(["（歌詞）", " 公式", " ライブ", " 字幕", " 吹き替え"])
+    out = out.mask(gen.random(n) < 0.18, out + gen.choice(["（歌詞）", " 公式", " ライブ", " 字幕", " 吹き替え"], size=n))
 
-    # random romaji case variation
-    if rng.random() < 0.15:
-        out = "".join(ch.upper() if rng.random() < 0.5 else ch.lower() for ch in out)
+    # random romaji case variation (whole query upper- or lower-cased)
+    case = gen.random(n) < 0.15
+    upper = gen.random(n) < 0.5
+    out = out.mask(case & upper, out.str.upper()).mask(case & ~upper, out.str.lower())
 
     # half-width katakana sprinkle (rare but a known ingestion/input smell)
-    if rng.random() < 0.05:
-        out = out + rng.choice(["ｶﾀｶﾅ", "ﾃｽﾄ"])
+    out = out.mask(gen.random(n) < 0.05, out + gen.choice(["ｶﾀｶﾅ", "ﾃｽﾄ"], size=n))
 
-    return out.strip()
+    return out.str.strip()
 
 
-def choose_device(rng: random.Random) -> str:
-    return rng.choices(["mobile", "desktop"], weights=[0.72, 0.28], k=1)[0]
+def _emit_raw(
+    cat: CatalogArrays,
+    n_searches: int,
+    user_pool: list[str],
+    gen: np.random.Generator,
+) -> pd.DataFrame:
+    """
+    Phase 1: emit sessions and queries (no results/clicks yet), one row per search event.
 
+    `start_sec` is the session start as seconds after the simulation window start.
+    """
+    n = n_searches
+
+    # Session plan: lengths drawn up front, last one trimmed to hit the search budget exactly.
+    # n draws always suffice since every session has at least one search.
+    ks = gen.choice([1, 2, 3, 4], size=n, p=[0.62, 0.24, 0.10, 0.04])
+    ks = ks[: np.searchsorted(np.cumsum(ks), n) + 1]
+    ks[-1] -= ks.sum() - n
+    n_sessions = len(ks)
+
+    session_of_event = np.repeat(np.arange(n_sessions), ks)
+    first_in_session = np.zeros(n, dtype=bool)
+    first_in_session[np.cumsum(ks) - ks] = True
+
+    # Per-session draws, broadcast to events; a "theme entity" per session allows reformulation
+    session_ids = np.asarray(bulk_ids("s", n_sessions), dtype=object)
+    users = gen.integers(0, len(user_pool), size=n_sessions)
+    devices = gen.choice(["mobile", "desktop"], size=n_sessions, p=[0.72, 0.28])
+    theme_idx = gen.integers(0, len(cat.titles), size=n_sessions)
+    start_sec = gen.integers(0, 60 * 24 * 14, size=n_sessions) * 60
+
+    entity_idx = theme_idx[session_of_event]
+    u_alias = gen.random(n)
+    u_pick = gen.random(n)
+
+    se = pd.DataFrame(
+        {
+            "event_id": bulk_ids("se", n),
+            "user_id": np.asarray(user_pool, dtype=object)[users[session_of_event]],
+            "session_id": session_ids[session_of_event],
+            "session_idx": session_of_event,
+            "start_sec": start_sec[session_of_event],
+            "first_in_session": first_in_session,
+            "locale": "JP",
+            "device": devices[session_of_event],
+            "query_raw": [
+                sample_query_from_entity(cat, i, a, b)
+                for i, a, b in zip(entity_idx.tolist(), u_alias.tolist(), u_pick.tolist())
+            ],
+            "vertical": np.asarray(cat.verticals, dtype=object)[entity_idx],
+        }
+    )
+    q = se["query_raw"].copy()
+
+    # sometimes create a "bad variant"
+    bad = gen.random(n) < 0.30
+    q.loc[bad] = make_bad_variants(q[bad], gen)
+
+    # create reformulation: later searches in a session sometimes add a clarifier (very JP-reasonable)
+    reform = ~se["first_in_session"] & (gen.random(n) < 0.55)
+    q = q.mask(reform, q + gen.choice([" 歌詞", " 主題歌", " 最新", " 最終回", " 口コミ"], size=n))
+
+    se["query_raw"] = q
 
-def choose_vertical(e_vertical: str, rng: random.Random) -> str:
     # Usually consistent with entity vertical, sometimes wrong due to user navigation or product confusion
-    if rng.random() < 0.92:
-        return e_vertical
-    return rng.choice(["music", "podcast", "tv"])
+    swap = gen.random(n) >= 0.92
+    se["vertical"] = np.where(swap, gen.choice(["music", "podcast", "tv"], size=n), se["vertical"].to_numpy(object))
+
+    se["query_norm"] = [normalize_query(x) for x in q]
+    se["query_len"] = q.str.len()
+    return se.join(script_flags(q))
+
+
+def _advance_clock(session_idx: np.ndarray, wait: np.ndarray) -> np.ndarray:
+    """
+    Seconds since session start for each event: the waits of the earlier events in the same session.
+
+    Segmented exclusive prefix sum; events of a session are contiguous and waits are positive.
+    """
+    elapsed = np.cumsum(wait) - wait
+    first = np.ones(len(wait), dtype=bool)
+    first[1:] = session_idx[1:] != session_idx[:-1]
+    return elapsed - np.maximum.accumulate(np.where(first, elapsed, 0))
+
+
+def _score(
+    se: pd.DataFrame,
+    cat: CatalogArrays,
+    base_ts: datetime,
+    gen: np.random.Generator,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Phase 2: results_count, clicks and timestamps, computed column-wise over all events.
+    """
+    n = len(se)
+    queries = se["query_raw"]
+    romaji = se["has_romaji"].to_numpy(bool)
+    half = se["has_halfwidth_kana"].to_numpy(bool)
+
+    # simulate results_count with some structured failure modes
+    # romaji queries fail more often; halfwidth fails more often;
+    # ambiguous keywords increase "badness"
+    ambig = queries.str.contains(AMBIG_RE).to_numpy(bool)
+    p_zero = 0.05 + 0.07 * romaji + 0.10 * half + 0.03 * ambig
+
+    results_count = np.where(
+        gen.random(n) < p_zero,
+        0,
+        gen.choice([1, 3, 5, 10, 25], size=n, p=[0.10, 0.20, 0.30, 0.25, 0.15]),
+    )
+
+    # simulate click behavior
+    # If results=0, no clicks.
+    lyrics = (queries.str.contains("歌詞", regex=False) | queries.str.contains("主題歌", regex=False)).to_numpy(bool)
+    p_no_click = 0.25 + 0.08 * romaji - 0.05 * (results_count <= 1) + 0.05 * lyrics
+    clicked = (results_count > 0) & (gen.random(n) >= p_no_click)
+
+    # click rank: better when query matches well; worse when noisy
+    base_rank = gen.choice([1, 2, 3, 4, 5, 7, 10], size=n, p=[0.35, 0.20, 0.14, 0.10, 0.08, 0.08, 0.05])
+    base_rank = np.where(romaji | half, np.minimum(10, base_rank + gen.integers(1, 4, size=n)), base_rank)
+    rank = np.clip(base_rank[clicked], 1, results_count[clicked])
+
+    dwell = gen.choice([5, 12, 30, 60, 120, 240], size=n, p=[0.10, 0.18, 0.26, 0.22, 0.16, 0.08])[clicked]
+
+    # time to the next search depends on what happened on this one
+    wait = np.select(
+        [results_count == 0, ~clicked],
+        [gen.integers(5, 26, size=n), gen.integers(8, 36, size=n)],
+        gen.integers(10, 46, size=n),
+    )
+    ts_sec = se["start_sec"].to_numpy() + _advance_clock(se["session_idx"].to_numpy(), wait)
+    click_delay = gen.integers(1, 11, size=n)[clicked]
+
+    se["ts"] = iso_jst(base_ts, ts_sec)
+    se["results_count"] = results_count
+
+    # pick some content_id (not necessarily "correct", but realistic)
+    n_clicks = int(clicked.sum())
+    content_ids = cat.content_ids[gen.integers(0, len(cat.content_ids), size=n_clicks)]
+
+    ce = pd.DataFrame(
+        {
+            "click_id": bulk_ids("ce", n_clicks),
+            "ts": iso_jst(base_ts, ts_sec[clicked] + click_delay),
+            "session_id": se["session_id"].to_numpy()[clicked],
+            "event_id": se["event_id"].to_numpy()[clicked],
+            "content_id": content_ids,
+            "rank": rank,
+            "dwell_sec": dwell,
+        }
+    )
+    return se, ce
 
 
 def simulate_sessions(
     catalog_internal: pd.DataFrame,
     n_searches: int,
-    rng: random.Random,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+    gen: np.random.Generator,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
     """
-    Produce search_events and click_events.
-    """
-    search_rows = []
-    click_rows = []
+    Produce search_events and click_events, yielded in batches of up to chunk_size searches.
 
-    # We'll make sessions by batching searches
-    searches_left = n_searches
+    Queries are emitted first (_emit_raw); results, clicks and timestamps are then computed
+    column-wise over all events (_score) instead of per event inside the loop.
+    Sessions never span two batches.
+    """
     base_ts = datetime.now(JST).replace(microsecond=0) - timedelta(days=14)
 
-    user_pool = [new_id("u") for _ in range(750)]
-
-    while searches_left > 0:
-        session_id = new_id("s")
-        user_id = rng.choice(user_pool)
-        device = choose_device(rng)
-
-        # number of searches in this session
-        k = min(searches_left, rng.choices([1, 2, 3, 4], weights=[0.62, 0.24, 0.10, 0.04], k=1)[0])
-        searches_left -= k
-
-        # pick a "theme entity" for session, to allow reformulation
-        entity = catalog_internal.sample(n=1).iloc[0]
-        e_vertical = str(entity["vertical"])
-
-        # time within session
-        t = base_ts + timedelta(minutes=int(rng.random() * 60 * 24 * 14))
-        last_query_norm = None
-
-        for i in range(k):
-            event_id = new_id("se")
-
-            q = sample_query_from_entity(entity, rng)
-
-            # sometimes create a "bad variant"
-            if rng.random() < 0.30:
-                q = make_bad_variant(q, rng)
-
-            qn = normalize_query(q)
-
-            # create reformulation: if repeated, modify slightly
-            if last_query_norm is not None and rng.random() < 0.55:
-                # add a clarifier (very JP-reasonable)
-                q = q + rng.choice([" 歌詞", " 主題歌", " 最新", " 最終回", " 口コミ"])
-                qn = normalize_query(q)
-
-            last_query_norm = qn
-
-            vertical = choose_vertical(e_vertical, rng)
-
-            # simulate results_count with some structured failure modes
-            # romaji queries fail more often; halfwidth fails more often
-            romaji_flag = has_romaji(q)
-            half_flag = has_halfwidth_kana(q)
-
-            p_zero = 0.05
-            if romaji_flag:
-                p_zero += 0.07
-            if half_flag:
-                p_zero += 0.10
-
-            # ambiguous keywords increase "badness"
-            if re.search(r"\bhero\b|グリーン|green", q, re.IGNORECASE):
-                p_zero += 0.03
-
-            zero = rng.random() < p_zero
-
-            if zero:
-                results_count = 0
-            else:
-                # some range of results
-                results_count = int(rng.choices([1, 3, 5, 10, 25], weights=[0.10, 0.20, 0.30, 0.25, 0.15], k=1)[0])
-
-            row = dict(
-                event_id=event_id,
-                ts=t.isoformat(),
-                user_id=user_id,
-                session_id=session_id,
-                locale="JP",
-                device=device,
-                query_raw=q,
-                query_norm=qn,
-                vertical=vertical,
-                results_count=results_count,
-                has_kanji=has_kanji(q),
-                has_kana=has_kana(q),
-                has_romaji=romaji_flag,
-                has_halfwidth_kana=half_flag,
-                query_len=len(q),
-            )
-            search_rows.append(row)
-
-            # simulate click behavior
-            # If results=0, no clicks.
-            if results_count == 0:
-                t += timedelta(seconds=rng.randint(5, 25))
-                continue
-
-            # no-click probability
-            p_no_click = 0.25
-            if romaji_flag:
-                p_no_click += 0.08
-            if results_count <= 1:
-                p_no_click -= 0.05
-            if "歌詞" in q or "主題歌" in q:
-                p_no_click += 0.05
-
-            if rng.random() < p_no_click:
-                t += timedelta(seconds=rng.randint(8, 35))
-                continue
-
-            # click rank: better when query matches well; worse when noisy
-            base_rank = rng.choices([1, 2, 3, 4, 5, 7, 10], weights=[0.35, 0.20, 0.14, 0.10, 0.08, 0.08, 0.05], k=1)[0]
-            if romaji_flag or half_flag:
-                base_rank = min(10, base_rank + rng.randint(1, 3))
-
-            rank = int(max(1, min(base_rank, results_count)))
-
-            dwell = int(rng.choices([5, 12, 30, 60, 120, 240], weights=[0.10, 0.18, 0.26, 0.22, 0.16, 0.08], k=1)[0])
-
-            # pick some content_id (not necessarily "correct", but realistic)
-            content_id = str(catalog_internal.sample(n=1).iloc[0]["content_id"])
-
-            click_rows.append(
-                dict(
-                    click_id=new_id("ce"),
-                    ts=(t + timedelta(seconds=rng.randint(1, 10))).isoformat(),
-                    session_id=session_id,
-                    event_id=event_id,
-                    content_id=content_id,
-                    rank=rank,
-                    dwell_sec=dwell,
-                )
-            )
-
-            t += timedelta(seconds=rng.randint(10, 45))
-
-    se = pd.DataFrame(search_rows)
-    ce = pd.DataFrame(click_rows)
-
-    # Ensure integer columns are int
-    for c in ["results_count", "has_kanji", "has_kana", "has_romaji", "has_halfwidth_kana", "query_len"]:
-        se[c] = se[c].astype(int)
-    for c in ["rank", "dwell_sec"]:
-        ce[c] = ce[c].astype(int)
+    user_pool = bulk_ids("u", 750)
+    cat = catalog_arrays(catalog_internal)
 
-    return se, ce
+    for start in range(0, n_searches, chunk_size):
+        n = min(chunk_size, n_searches - start)
+        se = _emit_raw(cat, n, user_pool, gen)
+        se, ce = _score(se, cat, base_ts, gen)
+
+        # Low-cardinality strings as categoricals, small non-negative ints downcast
+        for c in ["locale", "device", "vertical"]:
+            se[c] = se[c].astype("category")
+        for c in ["results_count", "has_kanji", "has_kana", "has_romaji", "has_halfwidth_kana", "query_len"]:
+            se[c] = pd.to_numeric(se[c], downcast="unsigned")
+        for c in ["rank", "dwell_sec"]:
+            ce[c] = pd.to_numeric(ce[c], downcast="unsigned")
+
+        yield se[SEARCH_EVENT_COLUMNS], ce[CLICK_EVENT_COLUMNS]
+
+
+def write_rows(writer, df: pd.DataFrame) -> None:
+    """
+    Write DataFrame rows through csv.writer from plain Python column lists (no to_csv formatting).
+    """
+    writer.writerows(zip(*(df[c].tolist() for c in df.columns)))
 
 
 def main() -> None:
@@ -444,13 +533,11 @@ def main() -> None:
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    rng = random.Random(args.seed)
-    np.random.seed(args.seed)
+    # One PCG64 generator drives every random draw
+    gen = np.random.default_rng(args.seed)
 
     seed_entities = build_seed_entities()
-    catalog_out, catalog_internal = expand_catalog(seed_entities, args.n_catalog, rng)
-
-    search_events, click_events = simulate_sessions(catalog_internal.assign(aliases=catalog_internal["aliases"]), args.n_searches, rng)
+    catalog_out, catalog_internal = expand_catalog(seed_entities, args.n_catalog, gen)
 
     # Write outputs that match schema exactly
     catalog_path = out_dir / "content_catalog.csv"
@@ -458,12 +545,28 @@ def main() -> None:
     click_path = out_dir / "click_events.csv"
 
     catalog_out.to_csv(catalog_path, index=False, encoding="utf-8")
-    search_events.to_csv(search_path, index=False, encoding="utf-8")
-    click_events.to_csv(click_path, index=False, encoding="utf-8")
+
+    # Event tables are streamed batch by batch straight through csv.writer
+    n_search_rows = 0
+    n_click_rows = 0
+    with (
+        open(search_path, "w", newline="", encoding="utf-8") as search_f,
+        open(click_path, "w", newline="", encoding="utf-8") as click_f,
+    ):
+        search_writer = csv.writer(search_f, lineterminator="\n")
+        click_writer = csv.writer(click_f, lineterminator="\n")
+        search_writer.writerow(SEARCH_EVENT_COLUMNS)
+        click_writer.writerow(CLICK_EVENT_COLUMNS)
+
+        for search_batch, click_batch in simulate_sessions(catalog_internal, args.n_searches, gen):
+            write_rows(search_writer, search_batch)
+            write_rows(click_writer, click_batch)
+            n_search_rows += len(search_batch)
+            n_click_rows += len(click_batch)
 
     print(f"Wrote: {catalog_path} ({len(catalog_out):,} rows)")
-    print(f"Wrote: {search_path} ({len(search_events):,} rows)")
-    print(f"Wrote: {click_path} ({len(click_events):,} rows)")
+    print(f"Wrote: {search_path} ({n_search_rows:,} rows)")
+    print(f"Wrote: {click_path} ({n_click_rows:,} rows)")
     print("Done.")
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
@@ -10,25 +11,28 @@ FIG_DIR = Path("reports/figures")
 IN_DIR = Path("reports/metrics_outputs")
 
 
-def script_label(row: pd.Series) -> str:
-    """Human-readable label for script flags."""
-    parts = []
-    if int(row["has_kanji"]) == 1:
-        parts.append("kanji")
-    if int(row["has_kana"]) == 1:
-        parts.append("kana")
-    if int(row["has_romaji"]) == 1:
-        parts.append("romaji")
-    if int(row["has_halfwidth_kana"]) == 1:
-        parts.append("halfwidth")
-    return "+".join(parts) if parts else "none"
+SCRIPT_FLAG_LABELS = {
+    "has_kanji": "kanji",
+    "has_kana": "kana",
+    "has_romaji": "romaji",
+    "has_halfwidth_kana": "halfwidth",
+}
+
+
+def script_labels(df: pd.DataFrame) -> pd.Series:
+    """Human-readable label for script flags, per row (e.g. "kanji+romaji", "none")."""
+    parts = pd.Series("", index=df.index, dtype=object)
+    for col, label in SCRIPT_FLAG_LABELS.items():
+        parts = parts + np.where(df[col].astype(int) == 1, f"{label}+", "")
+    parts = parts.str.rstrip("+")
+    return parts.mask(parts == "", "none")
 
 
 def plot_zero_results_by_script_flags() -> Path:
     df = pd.read_csv(IN_DIR / "m_by_script_flags.csv")
 
     # Add readable group label and filter very small groups to reduce noise.
-    df["group"] = df.apply(script_label, axis=1)
+    df["group"] = script_labels(df)
     df = df.sort_values(["searches"], ascending=False)
 
     # Optional: show only groups with at least N searches